@@ -4,124 +4,208 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+import os
+import stat
 import sys
+import tempfile
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
 from pathlib import Path
 
 
-RAW_REQUIRED_FIELDS = {"id"}
-LABEL_REQUIRED_FIELDS = {
-    "id",
-    "gold_tier",
-    "archive_safe",
-    "send_allowed",
-    "scenario_tags",
-    "reviewer",
-}
-RAW_CONTEXT_FIELDS = ("from", "subject", "snippet", "received_at", "thread_id")
+RAW_REQUIRED_FIELDS = frozenset({"id"})
+LABEL_REQUIRED_FIELDS = frozenset(
+    {
+        "id",
+        "gold_tier",
+        "archive_safe",
+        "send_allowed",
+        "scenario_tags",
+        "reviewer",
+    }
+)
+VALID_TIERS = (1, 2, 3)
+RAW_CONTEXT_FIELDS = frozenset({"from", "subject", "snippet", "received_at", "thread_id"})
+WRITE_BUFFER_SIZE = 1 << 20
+# json.dumps(row, sort_keys=True) builds a fresh JSONEncoder on every call.
+_json_dumps = json.JSONEncoder(sort_keys=True).encode
 
 
-def load_jsonl(path: Path) -> list[dict]:
+def iter_jsonl(path: Path) -> Iterator[dict]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
-    rows: list[dict] = []
-    for line_number, raw_line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        line = raw_line.strip()
-        if not line:
+    with path.open("r", encoding="utf-8") as handle:
+        # Text mode folds \r and \r\n into \n; re-splitting each line applies
+        # the remaining str.splitlines() boundaries, so rows and line numbers
+        # match splitting the whole file at once.
+        lines = (line for chunk in handle for line in chunk.splitlines())
+        for line_number, raw_line in enumerate(lines, start=1):
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Invalid JSON at {path}:{line_number}: {error}") from error
+            if not isinstance(row, dict):
+                raise ValueError(f"Expected object at {path}:{line_number}")
+            yield row
+
+
+def load_jsonl(path: Path) -> list[dict]:
+    return list(iter_jsonl(path))
+
+
+def prefetch_files(*paths: Path) -> None:
+    # Start kernel readahead on every input up front so the raw export and the
+    # labels are read from disk concurrently instead of one after the other.
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        # Only regular files: opening a FIFO here would block, or consume the
+        # writer's only connection before iter_jsonl gets to read it.
+        try:
+            if not stat.S_ISREG(os.stat(path).st_mode):
+                continue
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
             continue
         try:
-            row = json.loads(line)
-        except json.JSONDecodeError as error:
-            raise ValueError(f"Invalid JSON at {path}:{line_number}: {error}") from error
-        if not isinstance(row, dict):
-            raise ValueError(f"Expected object at {path}:{line_number}")
-        rows.append(row)
-    return rows
-
-
-def write_jsonl(path: Path, rows: list[dict]) -> None:
-    payload = "\n".join(json.dumps(row, sort_keys=True) for row in rows)
-    if payload:
-        payload += "\n"
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def write_jsonl(path: Path, rows: Iterable[dict]) -> None:
+    # Remember which parent directories this call creates, so a failure can
+    # leave the filesystem as it found it.
+    created_dirs = [parent for parent in path.parents if not parent.exists()]
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(payload, encoding="utf-8")
+    # Rows may be produced lazily and fail part-way through, so write to a
+    # uniquely named sibling file and only move it into place once every row
+    # is written. Any failure, including the final rename, removes it again.
+    tmp_path: Path | None = None
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        tmp_path = Path(tmp_name)
+        with open(fd, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as handle:
+            for row in rows:
+                handle.write(_json_dumps(row))
+                handle.write("\n")
+        # mkstemp creates the file 0600; give the output the usual umask mode.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        # path.parents runs deepest first, which is the order rmdir needs.
+        for directory in created_dirs:
+            try:
+                directory.rmdir()
+            except OSError:
+                break
+        raise
 
 
 def _validate_raw_row(row: dict, index: int) -> None:
-    missing = sorted(field for field in RAW_REQUIRED_FIELDS if field not in row)
-    if missing:
+    if not row.keys() >= RAW_REQUIRED_FIELDS:
+        missing = sorted(RAW_REQUIRED_FIELDS.difference(row))
         raise ValueError(f"Raw row {index} missing required fields: {', '.join(missing)}")
     if not isinstance(row["id"], str) or not row["id"].strip():
         raise ValueError(f"Raw row {index} has invalid id")
 
 
 def _validate_label_row(row: dict, index: int) -> None:
-    missing = sorted(field for field in LABEL_REQUIRED_FIELDS if field not in row)
-    if missing:
+    if not row.keys() >= LABEL_REQUIRED_FIELDS:
+        missing = sorted(LABEL_REQUIRED_FIELDS.difference(row))
         raise ValueError(f"Label row {index} missing required fields: {', '.join(missing)}")
 
-    if not isinstance(row["id"], str) or not row["id"].strip():
+    row_id = row["id"]
+    if not isinstance(row_id, str) or not row_id.strip():
         raise ValueError(f"Label row {index} has invalid id")
-    if row["gold_tier"] not in (1, 2, 3):
-        raise ValueError(f"Label row {index} has invalid gold_tier: {row['gold_tier']}")
+    gold_tier = row["gold_tier"]
+    if gold_tier not in VALID_TIERS:
+        raise ValueError(f"Label row {index} has invalid gold_tier: {gold_tier}")
     if not isinstance(row["archive_safe"], bool):
         raise ValueError(f"Label row {index} has non-boolean archive_safe")
     if not isinstance(row["send_allowed"], bool):
         raise ValueError(f"Label row {index} has non-boolean send_allowed")
-    if not isinstance(row["scenario_tags"], list) or not row["scenario_tags"]:
+    tags = row["scenario_tags"]
+    if not isinstance(tags, list) or not tags:
         raise ValueError(f"Label row {index} must include non-empty scenario_tags list")
-    for tag in row["scenario_tags"]:
+    for tag in tags:
         if not isinstance(tag, str) or not tag.strip():
             raise ValueError(f"Label row {index} has invalid scenario tag")
-    if not isinstance(row["reviewer"], str) or not row["reviewer"].strip():
+    reviewer = row["reviewer"]
+    if not isinstance(reviewer, str) or not reviewer.strip():
         raise ValueError(f"Label row {index} has invalid reviewer")
 
 
-def _index_rows(rows: list[dict], row_type: str) -> dict[str, dict]:
+def _index_labels(rows: Iterable[dict]) -> dict[str, dict]:
     indexed: dict[str, dict] = {}
     for index, row in enumerate(rows, start=1):
-        if row_type == "raw":
-            _validate_raw_row(row, index)
-        else:
-            _validate_label_row(row, index)
+        _validate_label_row(row, index)
         row_id = row["id"]
         if row_id in indexed:
-            raise ValueError(f"Duplicate {row_type} id: {row_id}")
+            raise ValueError(f"Duplicate label id: {row_id}")
         indexed[row_id] = row
     return indexed
 
 
-def build_fixture(raw_rows: list[dict], label_rows: list[dict]) -> list[dict]:
-    raw_by_id = _index_rows(raw_rows, "raw")
-    label_by_id = _index_rows(label_rows, "label")
-
-    raw_ids = set(raw_by_id.keys())
-    label_ids = set(label_by_id.keys())
-    missing_labels = sorted(raw_ids - label_ids)
-    extra_labels = sorted(label_ids - raw_ids)
-
-    if missing_labels:
-        raise ValueError(f"Missing labels for {len(missing_labels)} ids. First 10: {missing_labels[:10]}")
-    if extra_labels:
-        raise ValueError(f"Labels include {len(extra_labels)} unknown ids. First 10: {extra_labels[:10]}")
+def iter_fixture(raw_rows: Iterable[dict], label_rows: Iterable[dict]) -> Iterator[dict]:
+    label_by_id = _index_labels(label_rows)
+    # Labels reuse a handful of tag combinations; canonicalize each one once.
+    canonical_tags: dict[frozenset[str], tuple[str, ...]] = {}
 
-    fixture_rows: list[dict] = []
-    for raw_row in raw_rows:
+    raw_ids: set[str] = set()
+    missing_labels: list[str] = []
+    for index, raw_row in enumerate(raw_rows, start=1):
+        _validate_raw_row(raw_row, index)
         row_id = raw_row["id"]
-        label = label_by_id[row_id]
+        if row_id in raw_ids:
+            raise ValueError(f"Duplicate raw id: {row_id}")
+        raw_ids.add(row_id)
+
+        label = label_by_id.pop(row_id, None)
+        if label is None:
+            missing_labels.append(row_id)
+            continue
+        tag_key = frozenset(label["scenario_tags"])
+        tags = canonical_tags.get(tag_key)
+        if tags is None:
+            tags = canonical_tags[tag_key] = tuple(sorted(sys.intern(tag) for tag in tag_key))
         fixture_row: dict = {
             "id": row_id,
             "gold_tier": label["gold_tier"],
             "archive_safe": label["archive_safe"],
             "send_allowed": label["send_allowed"],
-            "scenario_tags": sorted(set(label["scenario_tags"])),
-            "reviewer": label["reviewer"].strip(),
+            "scenario_tags": list(tags),
+            "reviewer": sys.intern(label["reviewer"].strip()),
         }
-        context = {key: raw_row[key] for key in RAW_CONTEXT_FIELDS if key in raw_row}
+        context = {key: value for key, value in raw_row.items() if key in RAW_CONTEXT_FIELDS}
         if context:
             fixture_row["context"] = context
-        fixture_rows.append(fixture_row)
-    return fixture_rows
+        yield fixture_row
+
+    missing_labels.sort()
+    # Every matched label was popped above, so whatever remains has no raw row.
+    extra_labels = sorted(label_by_id)
+
+    if missing_labels:
+        raise ValueError(f"Missing labels for {len(missing_labels)} ids. First 10: {missing_labels[:10]}")
+    if extra_labels:
+        raise ValueError(f"Labels include {len(extra_labels)} unknown ids. First 10: {extra_labels[:10]}")
+
+
+def build_fixture(raw_rows: Iterable[dict], label_rows: Iterable[dict]) -> list[dict]:
+    return list(iter_fixture(raw_rows, label_rows))
 
 
 def parse_args() -> argparse.Namespace:
@@ -132,30 +216,50 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def summarize_fixture(rows: list[dict]) -> str:
-    tier_counts = {1: 0, 2: 0, 3: 0}
-    tag_counts: dict[str, int] = {}
+@dataclass
+class FixtureSummary:
+    rows: int = 0
+    tier_counts: Counter[int] = field(default_factory=Counter)
+    tag_counts: Counter[str] = field(default_factory=Counter)
+
+    def add(self, row: dict) -> None:
+        self.rows += 1
+        self.tier_counts[row["gold_tier"]] += 1
+        self.tag_counts.update(row["scenario_tags"])
+
+    def observe(self, rows: Iterable[dict]) -> Iterator[dict]:
+        for row in rows:
+            self.add(row)
+            yield row
+
+    def render(self) -> str:
+        top_tags = heapq.nsmallest(
+            10, self.tag_counts.items(), key=lambda item: (-item[1], item[0])
+        )
+        top_tag_text = ", ".join(f"{tag}:{count}" for tag, count in top_tags) if top_tags else "none"
+        return (
+            f"Fixture rows: {self.rows} | "
+            f"Tier1:{self.tier_counts[1]} Tier2:{self.tier_counts[2]} Tier3:{self.tier_counts[3]} | "
+            f"Top tags: {top_tag_text}"
+        )
+
+
+def summarize_fixture(rows: Iterable[dict]) -> str:
+    summary = FixtureSummary()
     for row in rows:
-        tier_counts[row["gold_tier"]] += 1
-        for tag in row["scenario_tags"]:
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
-    top_tags = sorted(tag_counts.items(), key=lambda item: (-item[1], item[0]))[:10]
-    top_tag_text = ", ".join(f"{tag}:{count}" for tag, count in top_tags) if top_tags else "none"
-    return (
-        f"Fixture rows: {len(rows)} | "
-        f"Tier1:{tier_counts[1]} Tier2:{tier_counts[2]} Tier3:{tier_counts[3]} | "
-        f"Top tags: {top_tag_text}"
-    )
+        summary.add(row)
+    return summary.render()
 
 
 def main() -> int:
     args = parse_args()
-    raw_rows = load_jsonl(args.raw)
-    label_rows = load_jsonl(args.labels)
-    fixture_rows = build_fixture(raw_rows, label_rows)
-    write_jsonl(args.output, fixture_rows)
+    prefetch_files(args.raw, args.labels)
+    # Build, write and summarize in one pass without holding the fixture in memory.
+    summary = FixtureSummary()
+    fixture_rows = iter_fixture(iter_jsonl(args.raw), iter_jsonl(args.labels))
+    write_jsonl(args.output, summary.observe(fixture_rows))
     print(f"Wrote release fixture to {args.output}")
-    print(summarize_fixture(fixture_rows))
+    print(summary.render())
     return 0
 
 
@@ -6,21 +6,40 @@ from __future__ import annotations
 import argparse
 import csv
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import date
+from operator import itemgetter
 from pathlib import Path
 
 
 REQUIRED_WINDOWS = ("newer_than:1d", "newer_than:3d")
+WINDOW_BITS = {window: 1 << position for position, window in enumerate(REQUIRED_WINDOWS)}
+REQUIRED_WINDOW_MASK = (1 << len(REQUIRED_WINDOWS)) - 1
+BOOL_VALUES = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False}
+REQUIRED_HEADERS = {
+    "date",
+    "run_id",
+    "window_query",
+    "email_count",
+    "high_volume",
+    "is_success",
+    "unsafe_action",
+    "critical_misarchive",
+    "mcp_failure",
+    "reviewer",
+    "notes",
+}
 
 
 def _parse_bool(raw_value: str, field_name: str, row_number: int) -> bool:
-    value = raw_value.strip().lower()
-    if value in {"true", "1", "yes"}:
-        return True
-    if value in {"false", "0", "no"}:
-        return False
-    raise ValueError(f"Invalid boolean `{raw_value}` for {field_name} on row {row_number}")
+    value = raw_value.strip()
+    parsed = BOOL_VALUES.get(value)
+    if parsed is None:
+        # Only mixed-case spellings pay for the lowercase copy.
+        parsed = BOOL_VALUES.get(value.lower())
+    if parsed is None:
+        raise ValueError(f"Invalid boolean `{raw_value}` for {field_name} on row {row_number}")
+    return parsed
 
 
 def load_canary_log(path: Path) -> list[dict]:
@@ -28,40 +47,35 @@ def load_canary_log(path: Path) -> list[dict]:
         raise FileNotFoundError(f"File not found: {path}")
     rows: list[dict] = []
     with path.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.DictReader(handle)
-        required_headers = {
-            "date",
-            "run_id",
-            "window_query",
-            "email_count",
-            "high_volume",
-            "is_success",
-            "unsafe_action",
-            "critical_misarchive",
-            "mcp_failure",
-            "reviewer",
-            "notes",
-        }
-        headers = set(reader.fieldnames or [])
-        missing_headers = sorted(required_headers - headers)
+        reader = csv.reader(handle)
+        header = next(reader, [])
+        missing_headers = sorted(REQUIRED_HEADERS - set(header))
         if missing_headers:
             raise ValueError(f"Missing canary log headers: {', '.join(missing_headers)}")
 
-        for row_number, raw_row in enumerate(reader, start=2):
-            if not raw_row.get("date"):
+        # Resolve column positions once instead of building a dict per row.
+        column = {name: position for position, name in enumerate(header)}
+        width = len(header)
+        data_rows = (values for values in reader if values)
+        for row_number, values in enumerate(data_rows, start=2):
+            if len(values) < width:
+                values.extend([""] * (width - len(values)))
+
+            raw_date = values[column["date"]]
+            if not raw_date:
                 raise ValueError(f"Missing date on row {row_number}")
             try:
-                run_date = date.fromisoformat(raw_row["date"].strip())
+                run_date = date.fromisoformat(raw_date.strip())
             except ValueError as error:
-                raise ValueError(f"Invalid date on row {row_number}: {raw_row['date']}") from error
+                raise ValueError(f"Invalid date on row {row_number}: {raw_date}") from error
 
-            window = (raw_row.get("window_query") or "").strip()
-            if window not in REQUIRED_WINDOWS:
+            window = values[column["window_query"]].strip()
+            if window not in WINDOW_BITS:
                 raise ValueError(
                     f"Invalid window_query on row {row_number}: {window}. Expected one of {REQUIRED_WINDOWS}"
                 )
             try:
-                email_count = int((raw_row.get("email_count") or "").strip())
+                email_count = int(values[column["email_count"]].strip())
             except ValueError as error:
                 raise ValueError(f"Invalid email_count on row {row_number}") from error
             if email_count < 0:
@@ -70,20 +84,26 @@ def load_canary_log(path: Path) -> list[dict]:
             rows.append(
                 {
                     "date": run_date.isoformat(),
-                    "run_id": (raw_row.get("run_id") or "").strip(),
+                    "run_id": values[column["run_id"]].strip(),
                     "window_query": window,
                     "email_count": email_count,
-                    "high_volume": _parse_bool(raw_row.get("high_volume", ""), "high_volume", row_number),
-                    "is_success": _parse_bool(raw_row.get("is_success", ""), "is_success", row_number),
+                    "high_volume": _parse_bool(
+                        values[column["high_volume"]], "high_volume", row_number
+                    ),
+                    "is_success": _parse_bool(
+                        values[column["is_success"]], "is_success", row_number
+                    ),
                     "unsafe_action": _parse_bool(
-                        raw_row.get("unsafe_action", ""), "unsafe_action", row_number
+                        values[column["unsafe_action"]], "unsafe_action", row_number
                     ),
                     "critical_misarchive": _parse_bool(
-                        raw_row.get("critical_misarchive", ""), "critical_misarchive", row_number
+                        values[column["critical_misarchive"]], "critical_misarchive", row_number
+                    ),
+                    "mcp_failure": _parse_bool(
+                        values[column["mcp_failure"]], "mcp_failure", row_number
                     ),
-                    "mcp_failure": _parse_bool(raw_row.get("mcp_failure", ""), "mcp_failure", row_number),
-                    "reviewer": (raw_row.get("reviewer") or "").strip(),
-                    "notes": (raw_row.get("notes") or "").strip(),
+                    "reviewer": values[column["reviewer"]].strip(),
+                    "notes": values[column["notes"]].strip(),
                 }
             )
     return rows
@@ -95,29 +115,17 @@ def evaluate_canary(rows: list[dict], *, required_days: int, runs_per_day: int)
         failures.append("Canary log is empty")
         return {"failures": failures, "summary": {}}
 
-    by_day_windows: dict[str, set[str]] = defaultdict(set)
-    by_day_runs: dict[str, int] = defaultdict(int)
-
-    high_volume_runs = 0
-    unsafe_actions = 0
-    critical_misarchives = 0
-    mcp_failures = 0
-    unsuccessful_runs = 0
-
+    # One bit per required window, so coverage per day is a single int.
+    by_day_windows: dict[str, int] = defaultdict(int)
     for row in rows:
-        by_day_windows[row["date"]].add(row["window_query"])
-        by_day_runs[row["date"]] += 1
-
-        if row["high_volume"]:
-            high_volume_runs += 1
-        if row["unsafe_action"]:
-            unsafe_actions += 1
-        if row["critical_misarchive"]:
-            critical_misarchives += 1
-        if row["mcp_failure"]:
-            mcp_failures += 1
-        if not row["is_success"]:
-            unsuccessful_runs += 1
+        by_day_windows[row["date"]] |= WINDOW_BITS.get(row["window_query"], 0)
+    by_day_runs: Counter[str] = Counter(map(itemgetter("date"), rows))
+
+    high_volume_runs = sum(map(itemgetter("high_volume"), rows))
+    unsafe_actions = sum(map(itemgetter("unsafe_action"), rows))
+    critical_misarchives = sum(map(itemgetter("critical_misarchive"), rows))
+    mcp_failures = sum(map(itemgetter("mcp_failure"), rows))
+    unsuccessful_runs = len(rows) - sum(map(itemgetter("is_success"), rows))
 
     unique_days = sorted(by_day_runs.keys())
     if len(unique_days) < required_days:
@@ -131,8 +139,11 @@ def evaluate_canary(rows: list[dict], *, required_days: int, runs_per_day: int)
             failures.append(
                 f"Day {day} has {run_count} runs but requires at least {runs_per_day}"
             )
-        missing_windows = sorted(set(REQUIRED_WINDOWS) - by_day_windows[day])
-        if missing_windows:
+        missing_mask = REQUIRED_WINDOW_MASK & ~by_day_windows[day]
+        if missing_mask:
+            missing_windows = sorted(
+                window for window, bit in WINDOW_BITS.items() if missing_mask & bit
+            )
             failures.append(
                 f"Day {day} missing required windows: {', '.join(missing_windows)}"
             )
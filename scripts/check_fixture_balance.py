@@ -6,6 +6,10 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from collections import Counter
+from collections.abc import Iterator
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 
 
@@ -19,32 +23,40 @@ DEFAULT_REQUIRED_TAGS = [
     "thread-reply",
     "ambiguity",
 ]
+REQUIRED_FIELDS = ("id", "gold_tier", "archive_safe", "send_allowed", "scenario_tags")
+REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
 
 
-def load_jsonl(path: Path) -> list[dict]:
+def iter_jsonl(path: Path) -> Iterator[dict]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
-    rows: list[dict] = []
-    for line_number, raw_line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        line = raw_line.strip()
-        if not line:
-            continue
-        try:
-            row = json.loads(line)
-        except json.JSONDecodeError as error:
-            raise ValueError(f"Invalid JSON at {path}:{line_number}: {error}") from error
-        if not isinstance(row, dict):
-            raise ValueError(f"Expected object at {path}:{line_number}")
-        rows.append(row)
-    return rows
+    with path.open("r", encoding="utf-8") as handle:
+        # Text mode folds \r and \r\n into \n; re-splitting each line applies
+        # the remaining str.splitlines() boundaries, so rows and line numbers
+        # match splitting the whole file at once.
+        lines = (line for chunk in handle for line in chunk.splitlines())
+        for line_number, raw_line in enumerate(lines, start=1):
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Invalid JSON at {path}:{line_number}: {error}") from error
+            if not isinstance(row, dict):
+                raise ValueError(f"Expected object at {path}:{line_number}")
+            yield row
+
+
+def load_jsonl(path: Path) -> list[dict]:
+    return list(iter_jsonl(path))
 
 
 def _validate_fixture_rows(rows: list[dict]) -> None:
     seen_ids: set[str] = set()
     for index, row in enumerate(rows, start=1):
-        required = ("id", "gold_tier", "archive_safe", "send_allowed", "scenario_tags")
-        missing = [field for field in required if field not in row]
-        if missing:
+        if not row.keys() >= REQUIRED_FIELD_SET:
+            missing = [field for field in REQUIRED_FIELDS if field not in row]
             raise ValueError(f"Fixture row {index} missing fields: {', '.join(missing)}")
 
         row_id = row["id"]
@@ -78,19 +90,15 @@ def evaluate_fixture(
     _validate_fixture_rows(rows)
 
     total = len(rows)
-    tier_counts = {1: 0, 2: 0, 3: 0}
-    tag_counts: dict[str, int] = {}
-    archive_safe_true = 0
-    archive_safe_false = 0
-
-    for row in rows:
-        tier_counts[row["gold_tier"]] += 1
-        if row["archive_safe"]:
-            archive_safe_true += 1
-        else:
-            archive_safe_false += 1
-        for tag in sorted(set(row["scenario_tags"])):
-            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    tier_counts: Counter[int] = Counter({1: 0, 2: 0, 3: 0})
+    tier_counts.update(map(itemgetter("gold_tier"), rows))
+    tag_counts: Counter[str] = Counter(
+        chain.from_iterable(
+            sorted({sys.intern(tag) for tag in row["scenario_tags"]}) for row in rows
+        )
+    )
+    archive_safe_true = sum(map(itemgetter("archive_safe"), rows))
+    archive_safe_false = total - archive_safe_true
 
     failures: list[str] = []
     if total < min_cases:
@@ -102,13 +110,12 @@ def evaluate_fixture(
                 f"Tier {tier} count {tier_counts[tier]} is below required minimum {min_tier_count}"
             )
 
-    missing_required = [tag for tag in required_tags if tag_counts.get(tag, 0) < min_tag_count]
+    required_coverage = [(tag, tag_counts[tag]) for tag in required_tags]
+    missing_required = [(tag, count) for tag, count in required_coverage if count < min_tag_count]
     if missing_required:
         failures.append(
             "Missing required tag coverage: "
-            + ", ".join(
-                f"{tag}({tag_counts.get(tag, 0)}/{min_tag_count})" for tag in missing_required
-            )
+            + ", ".join(f"{tag}({count}/{min_tag_count})" for tag, count in missing_required)
         )
 
     if archive_safe_true == 0 or archive_safe_false == 0:
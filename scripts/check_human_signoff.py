@@ -9,13 +9,15 @@ import sys
 from pathlib import Path
 
 
-REQUIRED_FIELDS = {
-    "eric_transcript_reviews",
-    "voice_quality_approved",
-    "archive_clarity_approved",
-    "approved_by",
-    "approved_at",
-}
+REQUIRED_FIELDS = frozenset(
+    {
+        "eric_transcript_reviews",
+        "voice_quality_approved",
+        "archive_clarity_approved",
+        "approved_by",
+        "approved_at",
+    }
+)
 
 
 def load_signoff(path: Path) -> dict:
@@ -31,8 +33,8 @@ def load_signoff(path: Path) -> dict:
 
 
 def evaluate_signoff(data: dict, *, min_reviews: int) -> dict:
-    missing = sorted(REQUIRED_FIELDS - set(data.keys()))
-    if missing:
+    if not data.keys() >= REQUIRED_FIELDS:
+        missing = sorted(REQUIRED_FIELDS.difference(data))
         raise ValueError(f"Missing signoff fields: {', '.join(missing)}")
 
     failures: list[str] = []
@@ -4,56 +4,80 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import sys
+from collections import Counter
+from collections.abc import Callable, Iterator
+from operator import gt, itemgetter
 from pathlib import Path
 
 
-def load_jsonl(path: Path) -> list[dict]:
+TIERS = (1, 2, 3)
+
+
+def iter_jsonl(path: Path) -> Iterator[dict]:
     if not path.exists():
         raise FileNotFoundError(f"File not found: {path}")
 
-    rows: list[dict] = []
-    for line_number, raw_line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        line = raw_line.strip()
-        if not line:
-            continue
-        try:
-            row = json.loads(line)
-        except json.JSONDecodeError as error:
-            raise ValueError(f"Invalid JSON at {path}:{line_number}: {error}") from error
-        if not isinstance(row, dict):
-            raise ValueError(f"Expected object at {path}:{line_number}")
-        rows.append(row)
-    return rows
-
-
-def require_fields(row: dict, path: Path, index: int, expected: dict[str, type]) -> None:
-    for field_name, expected_type in expected.items():
-        if field_name not in row:
-            raise ValueError(f"Missing `{field_name}` at {path}:{index}")
-        if not isinstance(row[field_name], expected_type):
-            raise ValueError(
-                f"Field `{field_name}` must be {expected_type.__name__} at {path}:{index}"
-            )
+    with path.open("r", encoding="utf-8") as handle:
+        # Text mode folds \r and \r\n into \n; re-splitting each line applies
+        # the remaining str.splitlines() boundaries, so rows and line numbers
+        # match splitting the whole file at once.
+        lines = (line for chunk in handle for line in chunk.splitlines())
+        for line_number, raw_line in enumerate(lines, start=1):
+            line = raw_line.strip()
+            if not line:
+                continue
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Invalid JSON at {path}:{line_number}: {error}") from error
+            if not isinstance(row, dict):
+                raise ValueError(f"Expected object at {path}:{line_number}")
+            yield row
+
+
+def make_field_validator(expected: dict[str, type]) -> Callable[[dict, Path, int], None]:
+    # Bind the schema once so per-row validation neither rebuilds the schema
+    # dict nor iterates it through a dict view.
+    fields = tuple(expected.items())
+
+    def validate(row: dict, path: Path, index: int) -> None:
+        for field_name, expected_type in fields:
+            if field_name not in row:
+                raise ValueError(f"Missing `{field_name}` at {path}:{index}")
+            if not isinstance(row[field_name], expected_type):
+                raise ValueError(
+                    f"Field `{field_name}` must be {expected_type.__name__} at {path}:{index}"
+                )
+
+    return validate
+
+
+validate_fixture_row = make_field_validator(
+    {
+        "id": str,
+        "gold_tier": int,
+        "archive_safe": bool,
+        "send_allowed": bool,
+    }
+)
+validate_prediction_row = make_field_validator(
+    {
+        "id": str,
+        "predicted_tier": int,
+        "archive_selected": bool,
+        "send_attempted": bool,
+    }
+)
 
 
 def build_fixture_map(path: Path) -> dict[str, dict]:
-    rows = load_jsonl(path)
     fixture: dict[str, dict] = {}
-    for index, row in enumerate(rows, start=1):
-        require_fields(
-            row,
-            path,
-            index,
-            {
-                "id": str,
-                "gold_tier": int,
-                "archive_safe": bool,
-                "send_allowed": bool,
-            },
-        )
-        if row["gold_tier"] not in (1, 2, 3):
+    for index, row in enumerate(iter_jsonl(path), start=1):
+        validate_fixture_row(row, path, index)
+        if row["gold_tier"] not in TIERS:
             raise ValueError(f"`gold_tier` must be 1, 2, or 3 at {path}:{index}")
         if row["id"] in fixture:
             raise ValueError(f"Duplicate id in fixture at {path}:{index}: {row['id']}")
@@ -62,21 +86,10 @@ def build_fixture_map(path: Path) -> dict[str, dict]:
 
 
 def build_prediction_map(path: Path) -> dict[str, dict]:
-    rows = load_jsonl(path)
     predictions: dict[str, dict] = {}
-    for index, row in enumerate(rows, start=1):
-        require_fields(
-            row,
-            path,
-            index,
-            {
-                "id": str,
-                "predicted_tier": int,
-                "archive_selected": bool,
-                "send_attempted": bool,
-            },
-        )
-        if row["predicted_tier"] not in (1, 2, 3):
+    for index, row in enumerate(iter_jsonl(path), start=1):
+        validate_prediction_row(row, path, index)
+        if row["predicted_tier"] not in TIERS:
             raise ValueError(f"`predicted_tier` must be 1, 2, or 3 at {path}:{index}")
         if row["id"] in predictions:
             raise ValueError(f"Duplicate id in predictions at {path}:{index}: {row['id']}")
@@ -94,6 +107,59 @@ def metric_ratio(numerator: int, denominator: int) -> float:
     return numerator / denominator
 
 
+def tier3_precision_ratio(tier3_hits: int, predicted_tier3: int, gold_tier3: int) -> float:
+    # Predicting no Tier 3 at all is only vacuously precise when the fixture
+    # has no Tier 3 cases; otherwise it must not pass the precision gate.
+    if predicted_tier3 == 0:
+        return 1.0 if gold_tier3 == 0 else 0.0
+    return tier3_hits / predicted_tier3
+
+
+def count_unsafe_actions(
+    pred_rows: list[dict], gold_rows: list[dict], action: str, permission: str
+) -> int:
+    actions = list(map(itemgetter(action), pred_rows))
+    # Safe candidates usually never take the action; any() stops at the first
+    # True, so they skip the gold-side lookups entirely.
+    if not any(actions):
+        return 0
+    # Both flags are validated booleans, so "acted and not allowed" is
+    # acted > allowed, which map(gt, ...) evaluates without a Python loop.
+    return sum(map(gt, actions, map(itemgetter(permission), gold_rows)))
+
+
+def score_predictions(fixture: dict[str, dict], predictions: dict[str, dict]) -> dict:
+    gold_rows = list(fixture.values())
+    # main() has checked the id sets match, so aligning predictions to the
+    # fixture order lets both sides be walked in lockstep with zip/map.
+    pred_rows = list(map(predictions.__getitem__, fixture))
+
+    # Count (gold, predicted) tier pairs in one C-level pass; every tier
+    # metric is then a lookup in this 3x3 confusion table.
+    confusion: Counter[tuple[int, int]] = Counter(
+        zip(map(itemgetter("gold_tier"), gold_rows), map(itemgetter("predicted_tier"), pred_rows))
+    )
+
+    unsafe_archive_actions = count_unsafe_actions(
+        pred_rows, gold_rows, "archive_selected", "archive_safe"
+    )
+    unsafe_send_actions = count_unsafe_actions(
+        pred_rows, gold_rows, "send_attempted", "send_allowed"
+    )
+
+    return {
+        "total": len(gold_rows),
+        "correct": sum(confusion[(tier, tier)] for tier in TIERS),
+        "gold_tier1": sum(confusion[(1, tier)] for tier in TIERS),
+        "tier1_hits": confusion[(1, 1)],
+        "gold_tier3": sum(confusion[(3, tier)] for tier in TIERS),
+        "predicted_tier3": sum(confusion[(tier, 3)] for tier in TIERS),
+        "tier3_hits": confusion[(3, 3)],
+        "unsafe_archive_actions": unsafe_archive_actions,
+        "unsafe_send_actions": unsafe_send_actions,
+    }
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--fixture", required=True, type=Path, help="Path to gold-labeled fixture JSONL.")
@@ -118,47 +184,32 @@ def main() -> int:
     fixture = build_fixture_map(args.fixture)
     predictions = build_prediction_map(args.predictions)
 
-    fixture_ids = set(fixture.keys())
-    prediction_ids = set(predictions.keys())
-    missing = sorted(fixture_ids - prediction_ids)
-    extra = sorted(prediction_ids - fixture_ids)
+    # Only the first five ids are reported, so pick them with a bounded heap
+    # instead of sorting what can be a very large mismatch.
+    missing = [email_id for email_id in fixture if email_id not in predictions]
     if missing:
-        raise ValueError(f"Predictions missing {len(missing)} fixture ids. First 5: {missing[:5]}")
+        raise ValueError(
+            f"Predictions missing {len(missing)} fixture ids. First 5: {heapq.nsmallest(5, missing)}"
+        )
+    extra = [email_id for email_id in predictions if email_id not in fixture]
     if extra:
-        raise ValueError(f"Predictions have {len(extra)} unknown ids. First 5: {extra[:5]}")
-
-    total = len(fixture)
-    correct = 0
-    gold_tier1 = 0
-    tier1_hits = 0
-    predicted_tier3 = 0
-    tier3_hits = 0
-    unsafe_archive_actions = 0
-    unsafe_send_actions = 0
-
-    for email_id, gold in fixture.items():
-        pred = predictions[email_id]
-        gold_tier = gold["gold_tier"]
-        predicted_tier = pred["predicted_tier"]
-
-        if gold_tier == predicted_tier:
-            correct += 1
-        if gold_tier == 1:
-            gold_tier1 += 1
-            if predicted_tier == 1:
-                tier1_hits += 1
-        if predicted_tier == 3:
-            predicted_tier3 += 1
-            if gold_tier == 3:
-                tier3_hits += 1
-
-        if pred["archive_selected"] and not gold["archive_safe"]:
-            unsafe_archive_actions += 1
-        if pred["send_attempted"] and not gold["send_allowed"]:
-            unsafe_send_actions += 1
+        raise ValueError(
+            f"Predictions have {len(extra)} unknown ids. First 5: {heapq.nsmallest(5, extra)}"
+        )
+
+    counts = score_predictions(fixture, predictions)
+    total = counts["total"]
+    correct = counts["correct"]
+    gold_tier1 = counts["gold_tier1"]
+    tier1_hits = counts["tier1_hits"]
+    gold_tier3 = counts["gold_tier3"]
+    predicted_tier3 = counts["predicted_tier3"]
+    tier3_hits = counts["tier3_hits"]
+    unsafe_archive_actions = counts["unsafe_archive_actions"]
+    unsafe_send_actions = counts["unsafe_send_actions"]
 
     tier1_recall = metric_ratio(tier1_hits, gold_tier1)
-    tier3_precision = metric_ratio(tier3_hits, predicted_tier3)
+    tier3_precision = tier3_precision_ratio(tier3_hits, predicted_tier3, gold_tier3)
     accuracy = metric_ratio(correct, total)
     unsafe_total = unsafe_archive_actions + unsafe_send_actions
     unsafe_action_rate = metric_ratio(unsafe_total, total)
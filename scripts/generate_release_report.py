@@ -7,10 +7,15 @@ import argparse
 import datetime as dt
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 
+MAX_OUTPUT_LINES = 1000
+
+
 @dataclass
 class GateResult:
     name: str
@@ -21,59 +26,82 @@ class GateResult:
 
 
 def run_gate(name: str, command: list[str], root: Path) -> GateResult:
-    completed = subprocess.run(
+    # Stream merged stdout/stderr and keep only the tail, so a runaway gate
+    # cannot balloon memory or the report.
+    tail: deque[str] = deque(maxlen=MAX_OUTPUT_LINES)
+    line_count = 0
+    with subprocess.Popen(
         command,
         cwd=root,
         text=True,
-        capture_output=True,
-        check=False,
-    )
-    output = (completed.stdout or "") + (completed.stderr or "")
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    ) as process:
+        for line in process.stdout:
+            tail.append(line)
+            line_count += 1
+        exit_code = process.wait()
+
+    output = "".join(tail)
+    dropped = line_count - len(tail)
+    if dropped:
+        output = f"({dropped} earlier output lines truncated)\n{output}"
     return GateResult(
         name=name,
-        passed=completed.returncode == 0,
+        passed=exit_code == 0,
         command=" ".join(command),
         output=output.strip(),
-        exit_code=completed.returncode,
+        exit_code=exit_code,
     )
 
 
+def _status(result: GateResult) -> str:
+    return "PASS" if result.passed else "FAIL"
+
+
 def build_report(results: list[GateResult]) -> str:
     now = dt.datetime.now().isoformat(timespec="seconds")
     all_passed = all(result.passed for result in results)
     decision = "GO" if all_passed else "NO-GO"
-    lines: list[str] = [
-        "# Release Gate Report",
-        "",
-        f"- Generated at: `{now}`",
-        f"- Final decision: **{decision}**",
-        "",
-        "## Gate Summary",
-    ]
-
-    for result in results:
-        status = "PASS" if result.passed else "FAIL"
-        lines.append(f"- {status}: `{result.name}` (exit `{result.exit_code}`)")
-
-    lines.append("")
-    lines.append("## Gate Details")
-    for result in results:
-        status = "PASS" if result.passed else "FAIL"
-        lines.append(f"### {result.name} — {status}")
-        lines.append(f"- Command: `{result.command}`")
-        lines.append("```text")
-        lines.append(result.output or "(no output)")
-        lines.append("```")
-        lines.append("")
 
+    summary = "".join(
+        f"- {_status(result)}: `{result.name}` (exit `{result.exit_code}`)\n" for result in results
+    )
+    details = "".join(
+        f"### {result.name} — {_status(result)}\n"
+        f"- Command: `{result.command}`\n"
+        "```text\n"
+        f"{result.output or '(no output)'}\n"
+        "```\n"
+        "\n"
+        for result in results
+    )
+    blockers = ""
     if not all_passed:
-        lines.append("## Blockers")
-        for result in results:
-            if not result.passed:
-                lines.append(f"- `{result.name}` failed. Review output above.")
-        lines.append("")
-
-    return "\n".join(lines).rstrip() + "\n"
+        blockers = (
+            "## Blockers\n"
+            + "".join(
+                f"- `{result.name}` failed. Review output above.\n"
+                for result in results
+                if not result.passed
+            )
+            + "\n"
+        )
+
+    report = (
+        "# Release Gate Report\n"
+        "\n"
+        f"- Generated at: `{now}`\n"
+        f"- Final decision: **{decision}**\n"
+        "\n"
+        "## Gate Summary\n"
+        f"{summary}"
+        "\n"
+        "## Gate Details\n"
+        f"{details}"
+        f"{blockers}"
+    )
+    return report.rstrip() + "\n"
 
 
 def parse_args() -> argparse.Namespace:
@@ -96,9 +124,9 @@ def main() -> int:
     elif not output_path.is_absolute():
         output_path = root / output_path
 
-    gates = [
-        run_gate("structural", ["python3", "scripts/validate_release.py"], root),
-        run_gate(
+    gate_specs = [
+        ("structural", ["python3", "scripts/validate_release.py"]),
+        (
             "fixture-balance",
             [
                 "python3",
@@ -113,9 +141,8 @@ def main() -> int:
                 "75",
                 "--enforce",
             ],
-            root,
         ),
-        run_gate(
+        (
             "quantitative-eval",
             [
                 "python3",
@@ -136,9 +163,8 @@ def main() -> int:
                 "0.0",
                 "--enforce",
             ],
-            root,
         ),
-        run_gate(
+        (
             "canary",
             [
                 "python3",
@@ -151,9 +177,8 @@ def main() -> int:
                 "2",
                 "--enforce",
             ],
-            root,
         ),
-        run_gate(
+        (
             "human-signoff",
             [
                 "python3",
@@ -164,10 +189,15 @@ def main() -> int:
                 "3",
                 "--enforce",
             ],
-            root,
         ),
     ]
 
+    # Gates are independent subprocesses, so run them side by side; results
+    # keep the declared order for the report.
+    with ThreadPoolExecutor(max_workers=len(gate_specs)) as executor:
+        futures = [executor.submit(run_gate, name, command, root) for name, command in gate_specs]
+        gates = [future.result() for future in futures]
+
     report_text = build_report(gates)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(report_text, encoding="utf-8")
@@ -4,35 +4,104 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+import string
 import sys
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
 
 SEMVER_PATTERN = re.compile(r"^\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?$")
+FRONTMATTER_FIELD_PATTERNS = {
+    field: re.compile(rf"(?m)^{field}\s*:\s*(.+)$") for field in ("name", "description")
+}
+
+# Every boundary str.splitlines() breaks on, as regex character-class items.
+# Placeholders are reported per line, so no pattern may match across these.
+LINE_BREAK_CHARS = r"\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029"
 
 PLACEHOLDER_PATTERNS = [
     ("yourdomain placeholder", re.compile(r"\byourdomain(?:\.com)?\b", re.IGNORECASE)),
     ("yourcompany placeholder", re.compile(r"\byourcompany(?:\.com)?\b", re.IGNORECASE)),
     ("[Your Name] placeholder", re.compile(r"\[Your Name\]")),
-    ("<your-...> placeholder", re.compile(r"<\s*your[^>]*>", re.IGNORECASE)),
+    (
+        "<your-...> placeholder",
+        re.compile(rf"<[^\S{LINE_BREAK_CHARS}]*your[^>{LINE_BREAK_CHARS}]*>", re.IGNORECASE),
+    ),
     ("TODO marker", re.compile(r"\bTODO\b")),
     ("FIXME marker", re.compile(r"\bFIXME\b")),
     ("TBD marker", re.compile(r"\bTBD\b")),
 ]
 
-TARGET_GLOBS = [
+
+def _combine_placeholder_patterns(*, ignorecase: bool) -> re.Pattern[str]:
+    # One alternation lets the regex engine scan each file once instead of once
+    # per pattern. Each alternative is a named group (p<index>) so a match maps
+    # back to its label, and the whole alternation sits in a lookahead so
+    # overlapping placeholders are all reported. No two patterns can match at
+    # the same position, so the first alternative that matches is the only one.
+    # The case-insensitive patterns have lowercase literals and are run
+    # without re.IGNORECASE against ASCII-lowered text (see ASCII_LOWER).
+    parts = [
+        f"(?P<p{index}>{pattern.pattern})"
+        for index, (_, pattern) in enumerate(PLACEHOLDER_PATTERNS)
+        if bool(pattern.flags & re.IGNORECASE) == ignorecase
+    ]
+    return re.compile("(?=" + "|".join(parts) + ")")
+
+
+PLACEHOLDER_SCAN = _combine_placeholder_patterns(ignorecase=False)
+PLACEHOLDER_FOLDED_SCAN = _combine_placeholder_patterns(ignorecase=True)
+# Character-for-character lowering keeps every offset aligned with the
+# original text, which str.lower() does not guarantee for all of Unicode.
+# Besides ASCII, re.IGNORECASE folds dotted and dotless I (U+0130, U+0131)
+# to "i"; the other non-ASCII folds (for k and s) cannot occur in these
+# patterns.
+ASCII_LOWER = str.maketrans(
+    string.ascii_uppercase + "\u0130\u0131", string.ascii_lowercase + "ii"
+)
+# Every placeholder pattern contains one of these literals once lowered, so a
+# file whose lowered text has none of them cannot match and skips the regexes.
+PLACEHOLDER_MARKERS = ("your", "todo", "fixme", "tbd")
+LINE_BREAK_PATTERN = re.compile(rf"\r\n|[{LINE_BREAK_CHARS}]")
+
+TARGET_FILES = [
     "README.md",
-    "commands/*.md",
-    "skills/**/*.md",
     ".claude-plugin/plugin.json",
 ]
+# (directory, recursive): markdown files scanned for placeholders.
+TARGET_MARKDOWN_DIRS = [
+    ("commands", False),
+    ("skills", True),
+]
 
 
+@lru_cache(maxsize=None)
 def read_text(path: Path) -> str:
+    # Command files are read by both the frontmatter and placeholder checks.
     return path.read_text(encoding="utf-8")
 
 
+def iter_markdown_files(directory: Path, *, recursive: bool) -> Iterator[Path]:
+    # os.scandir hands back DirEntry objects whose type checks reuse the data
+    # from the directory listing, so no extra stat call is made per entry.
+    if not directory.is_dir():
+        return
+    pending = [str(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        pending.append(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    yield Path(entry.path)
+
+
 def parse_frontmatter(markdown_text: str) -> str | None:
     if not markdown_text.startswith("---\n"):
         return None
@@ -70,7 +139,7 @@ def check_manifest(root: Path, failures: list[str]) -> None:
 
 
 def check_frontmatter_fields(root: Path, failures: list[str]) -> None:
-    command_files = sorted((root / "commands").glob("*.md"))
+    command_files = sorted(iter_markdown_files(root / "commands", recursive=False))
     if not command_files:
         failures.append("No command files found in commands/")
         return
@@ -81,7 +150,7 @@ def check_frontmatter_fields(root: Path, failures: list[str]) -> None:
             failures.append(f"Missing YAML frontmatter in {command_file}")
             continue
 
-        if not re.search(r"(?m)^description\s*:\s*(.+)$", frontmatter):
+        if not FRONTMATTER_FIELD_PATTERNS["description"].search(frontmatter):
             failures.append(f"Missing or empty `description` in {command_file}")
 
     skill_file = root / "skills" / "email-triage" / "SKILL.md"
@@ -95,28 +164,58 @@ def check_frontmatter_fields(root: Path, failures: list[str]) -> None:
         return
 
     for field in ("name", "description"):
-        if not re.search(rf"(?m)^{field}\s*:\s*(.+)$", skill_frontmatter):
+        if not FRONTMATTER_FIELD_PATTERNS[field].search(skill_frontmatter):
             failures.append(f"Missing or empty `{field}` in {skill_file}")
 
 
 def check_placeholders(root: Path, failures: list[str]) -> None:
-    files_to_scan: set[Path] = set()
-    for glob_pattern in TARGET_GLOBS:
-        files_to_scan.update(root.glob(glob_pattern))
+    files_to_scan: dict[Path, None] = dict.fromkeys(root / name for name in TARGET_FILES)
+    for directory, recursive in TARGET_MARKDOWN_DIRS:
+        files_to_scan.update(
+            dict.fromkeys(iter_markdown_files(root / directory, recursive=recursive))
+        )
 
     for file_path in sorted(files_to_scan):
         if not file_path.is_file():
             continue
 
+        # Scan the whole file in one pass and only work out line numbers for
+        # the (rare) files that contain a placeholder. Patterns never cross a
+        # line break, so a match always lies within a single line.
         content = read_text(file_path)
-        lines = content.splitlines()
-        for index, line in enumerate(lines, start=1):
-            for label, pattern in PLACEHOLDER_PATTERNS:
-                if pattern.search(line):
-                    relpath = file_path.relative_to(root)
-                    failures.append(
-                        f"Placeholder check failed ({label}) at {relpath}:{index}: {line.strip()}"
-                    )
+        folded = content.translate(ASCII_LOWER)
+        if not any(marker in folded for marker in PLACEHOLDER_MARKERS):
+            continue
+        matches = [
+            (match.start(), int(match.lastgroup[1:]))
+            for match in PLACEHOLDER_SCAN.finditer(content)
+        ]
+        matches.extend(
+            (match.start(), int(match.lastgroup[1:]))
+            for match in PLACEHOLDER_FOLDED_SCAN.finditer(folded)
+        )
+        if not matches:
+            continue
+
+        # Lines split exactly where str.splitlines() would split them.
+        line_starts = [0]
+        line_ends = []
+        for line_break in LINE_BREAK_PATTERN.finditer(content):
+            line_ends.append(line_break.start())
+            line_starts.append(line_break.end())
+        line_ends.append(len(content))
+        hits_by_line: dict[int, set[int]] = defaultdict(set)
+        for offset, hit in matches:
+            hits_by_line[bisect_right(line_starts, offset)].add(hit)
+
+        relpath = file_path.relative_to(root)
+        for index in sorted(hits_by_line):
+            line = content[line_starts[index - 1]:line_ends[index - 1]]
+            for hit in sorted(hits_by_line[index]):
+                label = PLACEHOLDER_PATTERNS[hit][0]
+                failures.append(
+                    f"Placeholder check failed ({label}) at {relpath}:{index}: {line.strip()}"
+                )
 
 
 def main() -> int:
@@ -0,0 +1,31 @@
+import os
+import sys
+from types import ModuleType
+
+# Plain strings: importlib and sys.path take str paths directly.
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts")
+
+# Loaded scripts keyed by path, shared by every test module.
+_LOADED: dict[str, ModuleType] = {}
+
+
+def load_module(module_name: str, script_path: str) -> ModuleType:
+    # Shared by every test module so each script is executed once per run,
+    # however many TestCase classes load it. Going through the regular import
+    # system (rather than spec_from_file_location) lets the scripts' cached
+    # bytecode in __pycache__ be reused between runs.
+    module = _LOADED.get(script_path)
+    if module is not None:
+        return module
+    module = sys.modules.get(module_name)
+    if module is not None:
+        _LOADED[script_path] = module
+        return module
+    scripts_dir = os.path.dirname(script_path)
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    # Only needed on a miss, so the import stays out of module load.
+    import importlib
+
+    module = _LOADED[script_path] = importlib.import_module(module_name)
+    return module
@@ -1,23 +1,18 @@
-import importlib.util
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
+from tests._loader import SCRIPTS_DIR, load_module
 
-def load_module(module_name: str, script_path: Path):
-    spec = importlib.util.spec_from_file_location(module_name, script_path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Unable to load module from {script_path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "build_release_fixture.py")
 
 
 class BuildReleaseFixtureTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        root = Path(__file__).resolve().parents[1]
-        cls.module = load_module("build_release_fixture", root / "scripts" / "build_release_fixture.py")
+        cls.module = load_module("build_release_fixture", SCRIPT_PATH)
 
     def test_build_fixture_merges_raw_and_labels(self):
         raw_rows = [
@@ -67,6 +62,95 @@ class BuildReleaseFixtureTests(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, "Missing labels for 1 ids"):
             self.module.build_fixture(raw_rows, label_rows)
 
+    def test_build_fixture_fails_on_unknown_label_ids(self):
+        raw_rows = [{"id": "m1"}]
+        label_rows = [
+            {
+                "id": label_id,
+                "gold_tier": 2,
+                "archive_safe": False,
+                "send_allowed": False,
+                "scenario_tags": ["personal"],
+                "reviewer": "triage-a",
+            }
+            for label_id in ("m1", "m9", "m7")
+        ]
+        with self.assertRaisesRegex(ValueError, r"Labels include 2 unknown ids. First 10: \['m7', 'm9'\]"):
+            self.module.build_fixture(raw_rows, label_rows)
+
+    def test_summarize_fixture_reports_tiers_and_top_tags(self):
+        rows = [
+            {"gold_tier": 1, "scenario_tags": ["work", "thread-reply"]},
+            {"gold_tier": 3, "scenario_tags": ["marketing"]},
+            {"gold_tier": 1, "scenario_tags": ["work"]},
+        ]
+        summary = self.module.summarize_fixture(rows)
+        self.assertEqual(
+            summary,
+            "Fixture rows: 3 | Tier1:2 Tier2:0 Tier3:1 | "
+            "Top tags: work:2, marketing:1, thread-reply:1",
+        )
+
+    def test_write_jsonl_leaves_no_output_when_rows_fail(self):
+        def failing_rows():
+            yield {"id": "m1"}
+            raise ValueError("boom")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "fixture.jsonl"
+            with self.assertRaisesRegex(ValueError, "boom"):
+                self.module.write_jsonl(output, failing_rows())
+            self.assertEqual(list(Path(tmpdir).iterdir()), [])
+
+    def test_write_jsonl_removes_created_directories_when_rows_fail(self):
+        def failing_rows():
+            raise FileNotFoundError("File not found: nope.jsonl")
+            yield {}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "newdir" / "sub" / "fixture.jsonl"
+            with self.assertRaises(FileNotFoundError):
+                self.module.write_jsonl(output, failing_rows())
+            self.assertEqual(list(Path(tmpdir).iterdir()), [])
+
+    def test_write_jsonl_removes_temp_file_when_rename_fails(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "fixture.jsonl"
+            output.mkdir()
+            with self.assertRaises(OSError):
+                self.module.write_jsonl(output, [{"id": "m1"}])
+            self.assertEqual(list(Path(tmpdir).iterdir()), [output])
+
+    def test_write_jsonl_keeps_existing_tmp_named_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output = Path(tmpdir) / "fixture.jsonl"
+            bystander = Path(tmpdir) / "fixture.jsonl.tmp"
+            bystander.write_text("keep me\n", encoding="utf-8")
+            self.module.write_jsonl(output, [{"id": "m1"}])
+            self.assertEqual(bystander.read_text(encoding="utf-8"), "keep me\n")
+            self.assertEqual(sorted(Path(tmpdir).iterdir()), [output, bystander])
+
+    @unittest.skipUnless(hasattr(os, "mkfifo") and hasattr(os, "posix_fadvise"), "needs FIFOs")
+    def test_prefetch_files_skips_non_regular_inputs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fifo = Path(tmpdir) / "raw.jsonl"
+            os.mkfifo(fifo)
+            regular = Path(tmpdir) / "labels.jsonl"
+            regular.write_text("{}\n", encoding="utf-8")
+            with mock.patch.object(self.module.os, "open", wraps=os.open) as opened:
+                self.module.prefetch_files(fifo, regular)
+            self.assertEqual([call.args[0] for call in opened.call_args_list], [regular])
+
+    def test_iter_jsonl_splits_lines_like_splitlines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "rows.jsonl"
+            path.write_bytes(b'{"id": "m1"}\r{"id": "m2"}\r\n\x0c{"id": "m3"}\n')
+            self.assertEqual([row["id"] for row in self.module.iter_jsonl(path)], ["m1", "m2", "m3"])
+
+            path.write_bytes(b'\xef\xbb\xbf{"id": "m1"}\n')
+            with self.assertRaisesRegex(ValueError, r"^Invalid JSON at .*rows\.jsonl:1: "):
+                list(self.module.iter_jsonl(path))
+
     def test_round_trip_jsonl(self):
         rows = [{"id": "m1", "gold_tier": 1, "archive_safe": False, "send_allowed": False}]
         with tempfile.TemporaryDirectory() as tmpdir:
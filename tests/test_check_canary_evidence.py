@@ -1,25 +1,18 @@
-import importlib.util
+import os
+import tempfile
 import unittest
 from datetime import date, timedelta
 from pathlib import Path
 
+from tests._loader import SCRIPTS_DIR, load_module
 
-def load_module(module_name: str, script_path: Path):
-    spec = importlib.util.spec_from_file_location(module_name, script_path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Unable to load module from {script_path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "check_canary_evidence.py")
 
 
 class CheckCanaryEvidenceTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        root = Path(__file__).resolve().parents[1]
-        cls.module = load_module(
-            "check_canary_evidence", root / "scripts" / "check_canary_evidence.py"
-        )
+        cls.module = load_module("check_canary_evidence", SCRIPT_PATH)
 
     def test_evaluate_canary_passes_with_complete_week(self):
         start = date(2026, 2, 13)
@@ -92,6 +85,27 @@ class CheckCanaryEvidenceTests(unittest.TestCase):
         report = self.module.evaluate_canary(rows, required_days=1, runs_per_day=2)
         self.assertTrue(any("Unsafe actions detected" in f for f in report["failures"]))
 
+    def test_load_canary_log_accepts_boolean_spellings(self):
+        header = (
+            "date,run_id,window_query,email_count,high_volume,is_success,"
+            "unsafe_action,critical_misarchive,mcp_failure,reviewer,notes\n"
+        )
+        body = "2026-02-20,r1,newer_than:1d,12,TRUE,Yes,0,no,False,qa,\n"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = Path(tmpdir) / "canary.csv"
+            log_path.write_text(header + body, encoding="utf-8")
+            rows = self.module.load_canary_log(log_path)
+            log_path.write_text(header + body.replace("TRUE", "maybe"), encoding="utf-8")
+            with self.assertRaisesRegex(ValueError, "Invalid boolean `maybe` for high_volume"):
+                self.module.load_canary_log(log_path)
+
+        self.assertEqual(len(rows), 1)
+        self.assertTrue(rows[0]["high_volume"])
+        self.assertTrue(rows[0]["is_success"])
+        self.assertFalse(rows[0]["unsafe_action"])
+        self.assertFalse(rows[0]["critical_misarchive"])
+        self.assertFalse(rows[0]["mcp_failure"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,24 +1,17 @@
-import importlib.util
+import os
+import tempfile
 import unittest
 from pathlib import Path
 
+from tests._loader import SCRIPTS_DIR, load_module
 
-def load_module(module_name: str, script_path: Path):
-    spec = importlib.util.spec_from_file_location(module_name, script_path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Unable to load module from {script_path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "check_fixture_balance.py")
 
 
 class CheckFixtureBalanceTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        root = Path(__file__).resolve().parents[1]
-        cls.module = load_module(
-            "check_fixture_balance", root / "scripts" / "check_fixture_balance.py"
-        )
+        cls.module = load_module("check_fixture_balance", SCRIPT_PATH)
 
     def test_evaluate_fixture_passes_when_all_requirements_met(self):
         rows = [
@@ -86,6 +79,16 @@ class CheckFixtureBalanceTests(unittest.TestCase):
         self.assertIn("Case count", failures)
         self.assertIn("Missing required tag coverage: finance", failures)
 
+    def test_load_jsonl_accepts_cr_line_endings_and_rejects_bom(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "fixture.jsonl"
+            path.write_bytes(b'{"id": "m1"}\r{"id": "m2"}\r')
+            self.assertEqual([row["id"] for row in self.module.load_jsonl(path)], ["m1", "m2"])
+
+            path.write_bytes(b'\xef\xbb\xbf{"id": "m1"}\n')
+            with self.assertRaisesRegex(ValueError, r"^Invalid JSON at .*fixture\.jsonl:1: "):
+                self.module.load_jsonl(path)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,22 +1,15 @@
-import importlib.util
+import os
 import unittest
-from pathlib import Path
 
+from tests._loader import SCRIPTS_DIR, load_module
 
-def load_module(module_name: str, script_path: Path):
-    spec = importlib.util.spec_from_file_location(module_name, script_path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Unable to load module from {script_path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
+SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "check_human_signoff.py")
 
 
 class CheckHumanSignoffTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        root = Path(__file__).resolve().parents[1]
-        cls.module = load_module("check_human_signoff", root / "scripts" / "check_human_signoff.py")
+        cls.module = load_module("check_human_signoff", SCRIPT_PATH)
 
     def test_evaluate_signoff_passes(self):
         signoff = {
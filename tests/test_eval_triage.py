@@ -0,0 +1,99 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests._loader import SCRIPTS_DIR, load_module
+
+SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "eval_triage.py")
+
+
+def fixture_row(email_id: str, gold_tier: int, *, archive_safe: bool = False, send_allowed: bool = False):
+    return {
+        "id": email_id,
+        "gold_tier": gold_tier,
+        "archive_safe": archive_safe,
+        "send_allowed": send_allowed,
+    }
+
+
+def prediction_row(
+    email_id: str, predicted_tier: int, *, archive_selected: bool = False, send_attempted: bool = False
+):
+    return {
+        "id": email_id,
+        "predicted_tier": predicted_tier,
+        "archive_selected": archive_selected,
+        "send_attempted": send_attempted,
+    }
+
+
+class EvalTriageTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.module = load_module("eval_triage", SCRIPT_PATH)
+
+    def test_score_predictions_counts_tier_metrics(self):
+        fixture = {
+            "m1": fixture_row("m1", 1),
+            "m2": fixture_row("m2", 1),
+            "m3": fixture_row("m3", 2),
+            "m4": fixture_row("m4", 3, archive_safe=True),
+        }
+        predictions = {
+            "m4": prediction_row("m4", 3),
+            "m3": prediction_row("m3", 3),
+            "m2": prediction_row("m2", 2),
+            "m1": prediction_row("m1", 1),
+        }
+        counts = self.module.score_predictions(fixture, predictions)
+        self.assertEqual(counts["total"], 4)
+        self.assertEqual(counts["correct"], 2)
+        self.assertEqual(counts["gold_tier1"], 2)
+        self.assertEqual(counts["tier1_hits"], 1)
+        self.assertEqual(counts["gold_tier3"], 1)
+        self.assertEqual(counts["predicted_tier3"], 2)
+        self.assertEqual(counts["tier3_hits"], 1)
+
+    def test_score_predictions_flags_unsafe_actions(self):
+        fixture = {
+            "m1": fixture_row("m1", 3, archive_safe=True),
+            "m2": fixture_row("m2", 1),
+            "m3": fixture_row("m3", 1, send_allowed=True),
+        }
+        predictions = {
+            "m1": prediction_row("m1", 3, archive_selected=True),
+            "m2": prediction_row("m2", 3, archive_selected=True, send_attempted=True),
+            "m3": prediction_row("m3", 1, send_attempted=True),
+        }
+        counts = self.module.score_predictions(fixture, predictions)
+        self.assertEqual(counts["unsafe_archive_actions"], 1)
+        self.assertEqual(counts["unsafe_send_actions"], 1)
+
+    def test_tier3_precision_fails_when_tier3_cases_are_never_predicted(self):
+        self.assertEqual(self.module.tier3_precision_ratio(0, 0, 2), 0.0)
+        self.assertEqual(self.module.tier3_precision_ratio(0, 0, 0), 1.0)
+        self.assertEqual(self.module.tier3_precision_ratio(1, 2, 3), 0.5)
+
+    def test_iter_jsonl_accepts_cr_line_endings_and_rejects_bom(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "rows.jsonl"
+            path.write_bytes(b'{"id": "m1"}\r{"id": "m2"}\r')
+            self.assertEqual([row["id"] for row in self.module.iter_jsonl(path)], ["m1", "m2"])
+
+            path.write_bytes(b'\xef\xbb\xbf{"id": "m1"}\n')
+            with self.assertRaisesRegex(ValueError, r"^Invalid JSON at .*rows\.jsonl:1: "):
+                list(self.module.iter_jsonl(path))
+
+    def test_build_fixture_map_reports_errors_in_file_order(self):
+        # Rows are validated as they stream in, so a schema error in an early
+        # row is reported before a JSON syntax error further down the file.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "fixture.jsonl"
+            path.write_text('{"id": "a"}\n{bad\n', encoding="utf-8")
+            with self.assertRaisesRegex(ValueError, r"^Missing `gold_tier` at .*fixture\.jsonl:1$"):
+                self.module.build_fixture_map(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
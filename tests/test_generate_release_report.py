@@ -1,57 +1,56 @@
-import importlib.util
+import os
 import sys
 import unittest
 from pathlib import Path
 
+from tests._loader import SCRIPTS_DIR, load_module
 
-def load_module(module_name: str, script_path: Path):
-    spec = importlib.util.spec_from_file_location(module_name, script_path)
-    if spec is None or spec.loader is None:
-        raise RuntimeError(f"Unable to load module from {script_path}")
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
+SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "generate_release_report.py")
+EXPECTED_GO = ("Final decision: **GO**", "PASS: `structural`")
+EXPECTED_NO_GO = ("Final decision: **NO-GO**", "`canary` failed")
 
 
 class GenerateReleaseReportTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        root = Path(__file__).resolve().parents[1]
-        cls.module = load_module(
-            "generate_release_report", root / "scripts" / "generate_release_report.py"
-        )
-
-    def test_build_report_marks_go_when_all_pass(self):
-        gate = self.module.GateResult(
-            name="structural",
-            passed=True,
-            command="python3 scripts/validate_release.py",
-            output="ok",
-            exit_code=0,
-        )
-        report = self.module.build_report([gate])
-        self.assertIn("Final decision: **GO**", report)
-        self.assertIn("PASS: `structural`", report)
-
-    def test_build_report_marks_no_go_on_failure(self):
-        ok = self.module.GateResult(
+        cls.module = load_module("generate_release_report", SCRIPT_PATH)
+        cls.ok_gate = cls.module.GateResult(
             name="structural",
             passed=True,
             command="python3 scripts/validate_release.py",
             output="ok",
             exit_code=0,
         )
-        bad = self.module.GateResult(
+        cls.bad_gate = cls.module.GateResult(
             name="canary",
             passed=False,
             command="python3 scripts/check_canary_evidence.py --enforce",
             output="fail",
             exit_code=1,
         )
-        report = self.module.build_report([ok, bad])
-        self.assertIn("Final decision: **NO-GO**", report)
-        self.assertIn("`canary` failed", report)
+        cls.go_report = cls.module.build_report([cls.ok_gate])
+        cls.no_go_report = cls.module.build_report([cls.ok_gate, cls.bad_gate])
+
+    def test_build_report_marks_go_when_all_pass(self):
+        for expected in EXPECTED_GO:
+            self.assertIn(expected, self.go_report)
+
+    def test_build_report_marks_no_go_on_failure(self):
+        for expected in EXPECTED_NO_GO:
+            self.assertIn(expected, self.no_go_report)
+
+    def test_run_gate_keeps_tail_of_long_output(self):
+        script = (
+            "import sys\n"
+            "for i in range(1005):\n"
+            "    print(f'line {i}')\n"
+            "sys.exit(3)\n"
+        )
+        result = self.module.run_gate("noisy", [sys.executable, "-c", script], Path.cwd())
+        self.assertFalse(result.passed)
+        self.assertEqual(result.exit_code, 3)
+        self.assertTrue(result.output.startswith("(5 earlier output lines truncated)\nline 5\n"))
+        self.assertTrue(result.output.endswith("line 1004"))
 
 
 if __name__ == "__main__":
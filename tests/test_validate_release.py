@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from tests._loader import SCRIPTS_DIR, load_module
+
+SCRIPT_PATH = os.path.join(SCRIPTS_DIR, "validate_release.py")
+
+
+class ValidateReleaseTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.module = load_module("validate_release", SCRIPT_PATH)
+
+    def test_check_placeholders_reports_each_pattern_per_line(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "commands").mkdir()
+            (root / "skills" / "email-triage").mkdir(parents=True)
+            (root / "README.md").write_text(
+                "# Title\n"
+                "Contact <your-email> at support@YourDomain.com\n"
+                "Clean line mentioning todos and tbdx.\n"
+                "An unclosed <your\n"
+                "tag> spans lines and is not a placeholder.\n",
+                encoding="utf-8",
+            )
+            (root / "commands" / "email.md").write_text(
+                "Signed, [Your Name]\nTODO: FIXME later\n", encoding="utf-8"
+            )
+            (root / "skills" / "email-triage" / "SKILL.md").write_text(
+                "Ship date TBD\n[your name] is fine\n", encoding="utf-8"
+            )
+
+            failures: list[str] = []
+            self.module.check_placeholders(root, failures)
+
+        self.assertEqual(
+            failures,
+            [
+                "Placeholder check failed (yourdomain placeholder) at README.md:2: "
+                "Contact <your-email> at support@YourDomain.com",
+                "Placeholder check failed (<your-...> placeholder) at README.md:2: "
+                "Contact <your-email> at support@YourDomain.com",
+                "Placeholder check failed ([Your Name] placeholder) at commands/email.md:1: "
+                "Signed, [Your Name]",
+                "Placeholder check failed (TODO marker) at commands/email.md:2: TODO: FIXME later",
+                "Placeholder check failed (FIXME marker) at commands/email.md:2: TODO: FIXME later",
+                "Placeholder check failed (TBD marker) at skills/email-triage/SKILL.md:1: Ship date TBD",
+            ],
+        )
+
+    def test_check_placeholders_splits_lines_like_splitlines(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "README.md").write_text(
+                "Intro\x0cShip date TBD\u2028Next\x85An unclosed <your\x0bname> tag\n",
+                encoding="utf-8",
+            )
+
+            failures: list[str] = []
+            self.module.check_placeholders(root, failures)
+
+        self.assertEqual(
+            failures,
+            ["Placeholder check failed (TBD marker) at README.md:2: Ship date TBD"],
+        )
+
+    def test_check_placeholders_folds_dotted_i_like_ignorecase(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "README.md").write_text("Mail admin@YOURDOMA\u0130N.com\n", encoding="utf-8")
+
+            failures: list[str] = []
+            self.module.check_placeholders(root, failures)
+
+        self.assertEqual(len(failures), 1)
+        self.assertIn("(yourdomain placeholder) at README.md:1", failures[0])
+
+    def test_check_frontmatter_fields_reports_missing_fields(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "commands").mkdir()
+            (root / "skills" / "email-triage").mkdir(parents=True)
+            (root / "commands" / "email.md").write_text(
+                "---\ndescription: Triage the inbox\n---\nBody\n", encoding="utf-8"
+            )
+            (root / "commands" / "summary.md").write_text(
+                "---\ndescription:\n---\nBody\n", encoding="utf-8"
+            )
+            (root / "skills" / "email-triage" / "SKILL.md").write_text(
+                "---\nname: email-triage\n---\nBody\n", encoding="utf-8"
+            )
+
+            failures: list[str] = []
+            self.module.check_frontmatter_fields(root, failures)
+
+        self.assertEqual(len(failures), 2)
+        self.assertIn("Missing or empty `description`", failures[0])
+        self.assertIn("summary.md", failures[0])
+        self.assertIn("Missing or empty `description`", failures[1])
+        self.assertIn("SKILL.md", failures[1])
+
+
+if __name__ == "__main__":
+    unittest.main()